@@ -1,210 +1,490 @@
 #!/usr/bin/env python3
 
+import argparse
+import asyncio
+import functools
+import itertools
 import logging
-import multiprocessing
+import os
 import random
 import sys
 import time
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from playwright.sync_api import sync_playwright, Page, Browser
-from typing import Optional, List, Dict
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from playwright.async_api import async_playwright, expect, Page, Browser, BrowserContext, Locator, Playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from typing import Callable, Optional, List, Dict, Tuple
 
-SAMPLE_FIRST_NAMES = [
+# Everything the script logs goes through this one logger (configured in setup_logging)
+log = logging.getLogger("survey_fill")
+
+try:
+    # Optional: a faster event loop for the many small reads on the Playwright connection
+    import uvloop
+except ImportError:
+    uvloop = None
+
+SAMPLE_FIRST_NAMES = (
     "Avinash", "Aditya", "Arjun", "Atharva", "Aryan", "Shubhi", "Ayush", "Chinmay", "Durga", "Dev",
     "Dhruv", "Deepanshu", "Harsh", "Jatin", "Manjot", "Neerja", "Lakshay", "Madhav", "Gauri", "Ananya",
     "Pranav", "Rohan", "Pratham", "Tanaya", "Sneha", "Udayan", "Varun", "Yash", "Kirti",
     "Avandhika", "Aditi", "Anjali", "Bhavya", "Devishi", "Vaishnavi", "Esha", "Vidhur", "Pratham", "Ishita",
     "Indira", "Nishita", "Kavita", "Lakshmi", "Meera", "Neha", "Ojas", "Priyanshu", "Jasmine", "Khushi",
     "Tanvi", "Urvashi", "Anushka", "Yamini", "Sara"
-]
+)
 
-SAMPLE_LAST_NAMES = [
+SAMPLE_LAST_NAMES = (
     "Agarwal", "Ahuja", "Bansal", "Chauhan", "Desai", "Gandhi", "Gupta", "Iyer", "Jain", "Kapoor",
     "Kumar", "Malhotra", "Mehta", "Nair", "Patel", "Tiwari", "Sharma", "Singh", "Shah", "Verma",
     "Yadav", "Zaveri"
+)
+
+# Every first/last combination, built once so a random full name is a single index
+NAME_POOL = tuple(f"{first} {last}" for first in SAMPLE_FIRST_NAMES for last in SAMPLE_LAST_NAMES)
+
+SAMPLE_EMAIL_DOMAINS = ("@gmail.com", "@outlook.com")
+SAMPLE_AGES = tuple(range(17, 25))
+GENDER_CODES = ('F', 'M')
+
+# Full gender and the MCQ option labels that match it, by gender code
+GENDER_MAP = {
+    'F': {'full': 'Female', 'options': ('Female', 'F', 'Girl', 'Woman', 'female')},
+    'M': {'full': 'Male', 'options': ('Male', 'M', 'Boy', 'Man', 'male')}
+}
+OTHER_GENDER = {'full': 'Other', 'options': ('Other', 'Prefer not to say', 'other')}
+
+# Custom name input: name, age and gender code (F/M), e.g. "Ananya19F"
+CUSTOM_NAME_RE = re.compile(r'([A-Za-z][A-Za-z ]*?)\s*(\d+)\s*([FMfm])')
+# A parsed custom name: (name, age, gender code, original input)
+CustomName = Tuple[str, str, str, str]
+# Characters stripped from a name before it is used as an email local part
+EMAIL_CLEAN_RE = re.compile(r'[^a-zA-Z0-9]')
+
+# Question-text keywords for each personal field, in priority order, each with its own word
+# boundaries: email may run on ("emailaddress") and name may be a compound ("Surname")
+FIELD_KEYWORDS = [
+    ("email", r'\be-?mails?'),
+    ("name", r'\b\w*names?\b'),
+    ("age", r'\b(?:age|how old|year of birth|birth year)\b'),
+    ("gender", r'\b(?:gender|sex|male/female|man/woman)\b'),
 ]
+FIELD_PRIORITY = tuple(field for field, _ in FIELD_KEYWORDS)
+# All keywords in one pattern; each match's named group tells which field it belongs to
+FIELD_TYPE_RE = re.compile(
+    "|".join(f"(?P<{field}>{keywords})" for field, keywords in FIELD_KEYWORDS),
+    re.IGNORECASE
+)
+
+SHORT_RESPONSES = ("Yes", "No", "Maybe", "Sometimes", "Often")
+PARAGRAPH_RESPONSES = (
+    "This is a detailed response.",
+    "Based on my experience, this is the best approach."
+)
+# Text fields filled from the submission's user data rather than canned responses
+PERSONAL_TEXT_FIELDS = ("name", "email", "age")
+
+# Headless form filling needs no GPU, extensions, images or background services; dropping
+# the zygote and the accelerated canvas/WebGL paths also shrinks each renderer's memory
+CHROMIUM_ARGS = [
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--no-zygote',
+    '--disable-gpu',
+    '--disable-accelerated-2d-canvas',
+    '--disable-webgl',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-sync',
+    '--disable-default-apps',
+    '--blink-settings=imagesEnabled=false',
+    '--no-first-run'
+]
+VIEWPORT = {'width': 1280, 'height': 800}
+
+def usable_cpu_count() -> int:
+    """CPUs this process may actually run on, honouring its affinity mask (and so cpuset limits)."""
+    if hasattr(os, "process_cpu_count"):  # Python 3.13+
+        return os.process_cpu_count() or 1
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+CPU_COUNT = usable_cpu_count()
+
+# Concurrent in-flight submissions per process. The work is I/O-bound, so this is
+# limited by the memory of the open contexts rather than by the number of cores
+DEFAULT_CONCURRENCY = 32
+
+# Contexts opened on one browser before it is replaced with a fresh process
+BROWSER_MAX_USES = 100
+
+# A healthy form responds in a second or two; fail fast instead of stalling a worker
+DEFAULT_TIMEOUT_MS = 8000
+NAVIGATION_TIMEOUT_MS = 15000
+FORM_LOAD_TIMEOUT_MS = 30000
+CONFIRMATION_TIMEOUT_MS = 10000
+DROPDOWN_OPEN_TIMEOUT_MS = 5000
+
+# Progress is logged every PROGRESS_LOG_INTERVAL completions, formatted lazily by logging
+PROGRESS_LOG_INTERVAL = 50
+PROGRESS_TEMPLATE = "Completed %d/%d submissions. Current rate: %.2f/sec"
+SUMMARY_TEMPLATE = """
+%s completed:
+- Total submissions attempted: %d
+- Successful submissions: %d
+- Failed submissions: %d
+- Time taken: %.2f seconds
+- Average rate: %.2f submissions/second
+"""
+
+QUESTION_SELECTOR = "div[role='listitem']"
+SHORT_ANSWER_SELECTOR = "input[type='text'], input[type='email']"
+PARAGRAPH_SELECTOR = "textarea"
+# Any of these marks a rendered question; used to detect that the form has loaded
+FORM_QUESTION_SELECTOR = f"{QUESTION_SELECTOR}, .freebirdFormviewerComponentsQuestionBaseRoot"
+SUBMIT_BUTTON_NAME_RE = re.compile(r'submit', re.IGNORECASE)
+# Fallbacks for submit buttons without an accessible name
+SUBMIT_BUTTON_SELECTOR = ", ".join([
+    "div[role='button']:has-text('Submit')",
+    "button:has-text('Submit')",
+    ".freebirdFormviewerViewNavigationSubmitButton",
+    "div[jsname='M2UYVd']",
+    "input[type='submit']"
+])
+
+# Visible dropdown controls of a question; the same elements the plan scan counts as dropdowns
+DROPDOWN_SELECTOR = "select:visible, div[role='listbox']:visible"
+# Options of an opened (non-native) dropdown
+DROPDOWN_OPTION_SELECTOR = "div[role='option']:visible, .quantumWizMenuPaperselectOption:visible"
+CONFIRMATION_SELECTOR = ".freebirdFormviewerViewResponseConfirmationMessage"
+CONFIRMATION_TEXT = "Your response has been recorded"
+
+# In-page visibility test mirroring Playwright's own: a non-empty box that is not visibility:hidden
+VISIBLE_JS = """
+    const visible = el => {
+        const box = el.getBoundingClientRect();
+        return box.width > 0 && box.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+    };
+"""
+# Walks every list item in one evaluate call and returns a plan step for each question
+# (minus field_type, which is derived from the text in Python)
+EXTRACT_PLAN_JS = """
+selector => {""" + VISIBLE_JS + """
+    const first = (q, sel) => Array.from(q.querySelectorAll(sel)).find(visible);
+    const optionText = el => ((el.parentElement && el.parentElement.innerText) || el.getAttribute('aria-label') || '').toLowerCase();
+    const plan = [];
+    document.querySelectorAll(selector).forEach((q, idx) => {
+        if (!visible(q) || !q.querySelector("input, textarea, select, [role='radio'], [role='checkbox'], [role='listbox']")) {
+            return;
+        }
+        const heading = q.querySelector("div[role='heading'] span") || q.querySelector("div[role='heading']");
+        const lines = (heading ? heading.innerText : q.innerText).split('\\n').map(l => l.trim()).filter(Boolean);
+        const step = {idx, text: lines.length ? lines[0] : 'Unknown Question', type: 'unknown'};
+        const radios = Array.from(q.querySelectorAll("div[role='radio'], input[type='radio']")).filter(visible);
+        const dropdowns = Array.from(q.querySelectorAll("select, div[role='listbox']")).filter(visible).length;
+        if (dropdowns) {
+            step.type = dropdowns > 1 ? 'multi_dropdown' : 'dropdown';
+        } else if (radios.length) {
+            step.type = 'multiple_choice';
+            step.options = radios.map(optionText);
+        } else if (first(q, "div[role='checkbox'], input[type='checkbox']")) {
+            step.type = 'checkbox';
+            step.checkboxes = Array.from(q.querySelectorAll("div[role='checkbox'], input[type='checkbox']")).filter(visible).length;
+        } else if (first(q, "input[type='text'], input[type='email']")) {
+            step.type = 'short_answer';
+        } else if (first(q, 'textarea')) {
+            step.type = 'paragraph';
+        }
+        plan.push(step);
+    });
+    return plan;
+}
+"""
+# Clicks the given visible radio of a question, or a random one other than "Other"
+CLICK_RADIO_JS = """
+([selector, idx, choice]) => {""" + VISIBLE_JS + """
+    const q = document.querySelectorAll(selector)[idx];
+    const options = Array.from(q.querySelectorAll("div[role='radio'], input[type='radio']")).filter(visible);
+    let option = options[choice];
+    if (choice === null) {
+        const candidates = options.filter(o => o.getAttribute('data-value') !== '__other_option__');
+        option = candidates[Math.floor(Math.random() * candidates.length)];
+    }
+    if (!option) {
+        return false;
+    }
+    option.click();
+    return true;
+}
+"""
+# Clicks the visible checkboxes of a question at the given positions
+CLICK_CHECKBOXES_JS = """
+([selector, idx, indices]) => {""" + VISIBLE_JS + """
+    const q = document.querySelectorAll(selector)[idx];
+    const boxes = Array.from(q.querySelectorAll("div[role='checkbox'], input[type='checkbox']")).filter(visible);
+    indices.forEach(i => boxes[i] && boxes[i].click());
+}
+"""
+# Sets each [question idx, field selector, value] through the native value setter and fires
+# the input/change events the form listens for; returns the fills whose field was not in the page
+FILL_TEXT_JS = """
+([selector, fills]) => {
+    const questions = document.querySelectorAll(selector);
+    return fills.filter(([idx, field, value]) => {
+        const el = questions[idx] && questions[idx].querySelector(field);
+        if (!el) return true;
+        Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set.call(el, value);
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+        return false;
+    });
+}
+"""
+
+# Resources the form never needs in order to be filled and submitted. Stylesheets stay:
+# Google's radios and checkboxes are empty divs sized by CSS, and every visibility check is layout based
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+# Trackers and web-font hosts, matched against the full request URL in one search
+BLOCKED_URL_RE = re.compile(r'google-analytics\.com|googletagmanager\.com|doubleclick\.net|fonts\.(?:googleapis|gstatic)\.com')
+
+async def block_unneeded_resources(route):
+    """Abort requests for assets and trackers; let documents, scripts and XHRs through."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_URL_RE.search(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+class BrowserPool:
+    """A fixed set of shared browsers that hand out one fresh context per submission.
+
+    Browsers are used round-robin and are never held exclusively; contexts are
+    what isolate submissions. After max_uses contexts a browser is retired: a
+    replacement takes its slot and the old one is closed once its last
+    context has been released, which keeps long runs from accumulating
+    Chromium's per-process memory growth.
+    """
 
-SAMPLE_EMAIL_DOMAINS = [ "@gmail.com", "@outlook.com"]
-SAMPLE_AGES = list(range(17, 25))
+    def __init__(
+        self, playwright: Playwright, size: int = 1, cdp_url: Optional[str] = None, max_uses: int = BROWSER_MAX_USES,
+        headless: bool = True
+    ):
+        self.playwright = playwright
+        self.size = size
+        self.cdp_url = cdp_url
+        self.headless = headless
+        self.max_uses = max_uses
+        self.browsers: asyncio.Queue = asyncio.Queue()
+        self.uses: Dict[Browser, int] = {}
+        self.retired: List[Browser] = []
+        # Contexts handed out and not yet released, with the browser each belongs to
+        self.open_contexts: Dict[BrowserContext, Browser] = {}
+        # new_context() calls still in flight, by browser
+        self.opening: Counter = Counter()
+        # Contexts opened ahead of time by warm(), handed out before any new ones
+        self.ready: List[BrowserContext] = []
 
-class FormFiller:
-    def __init__(self, form_url: str, submission_count: int, names: List[str], start_name_index: int = 0):
+    async def start(self):
+        """Launch (or connect to) every browser in the pool."""
+        browsers = await asyncio.gather(*[self.launch() for _ in range(self.size)])
+        for browser in browsers:
+            self.browsers.put_nowait(browser)
+
+    async def launch(self) -> Browser:
+        """Start a browser, or attach to the external one when a CDP URL is configured."""
+        if self.cdp_url:
+            # Attach to an already running Chromium instead of paying for a launch
+            browser = await self.playwright.chromium.connect_over_cdp(self.cdp_url)
+        else:
+            browser = await self.playwright.chromium.launch(
+                headless=self.headless,
+                args=CHROMIUM_ARGS
+            )
+        self.uses[browser] = 0
+        return browser
+
+    async def warm(self, count: int):
+        """Open count contexts up front so the first wave of submissions doesn't wait for them."""
+        contexts = await asyncio.gather(*[self.open_context() for _ in range(count)])
+        self.ready.extend(contexts)
+
+    async def new_context(self) -> BrowserContext:
+        """Hand out a pre-opened context if one is left, else open a fresh one."""
+        if self.ready:
+            return self.ready.pop()
+        return await self.open_context()
+
+    async def open_context(self) -> BrowserContext:
+        """Open a fresh context on the next browser in the rotation."""
+        browser = await self.browsers.get()
+        retiring = None
+        if self.uses[browser] >= self.max_uses:
+            # The slot is only held while the replacement launches
+            try:
+                replacement = await self.launch()
+            except BaseException:
+                self.browsers.put_nowait(browser)
+                raise
+            browser, retiring = replacement, browser
+        # Counted and back in the rotation before the context opens, so other callers can open theirs meanwhile
+        self.uses[browser] += 1
+        self.opening[browser] += 1
+        self.browsers.put_nowait(browser)
+        try:
+            if retiring is not None:
+                await self.retire(retiring)
+            context = await browser.new_context(viewport=VIEWPORT)
+            self.open_contexts[context] = browser
+            return context
+        finally:
+            self.opening[browser] -= 1
+            await self.close_if_drained(browser)
+
+    def busy(self, browser: Browser) -> bool:
+        """Whether a browser has contexts open or being opened."""
+        return self.opening[browser] > 0 or browser in self.open_contexts.values()
+
+    async def retire(self, browser: Browser):
+        """Take a browser out of service, closing it now if none of its contexts are still open."""
+        if self.busy(browser):
+            # close_if_drained() closes it once its last context is done
+            self.retired.append(browser)
+        else:
+            await self.close_browser(browser)
+
+    async def close_if_drained(self, browser: Browser):
+        """Close a retired browser once it has no contexts left."""
+        if browser in self.retired and not self.busy(browser):
+            self.retired.remove(browser)
+            await self.close_browser(browser)
+
+    async def close_browser(self, browser: Browser):
+        """Close a browser that has left the rotation."""
+        del self.uses[browser]
+        del self.opening[browser]
+        try:
+            await browser.close()
+        except Exception as e:
+            log.error("Error closing browser: %s", e)
+
+    async def release(self, context: BrowserContext):
+        """Close a context and shut down retired browsers that no longer have any open."""
+        browser = self.open_contexts.pop(context, None)
+        try:
+            await context.close()
+        finally:
+            await self.close_if_drained(browser)
+
+    async def close(self):
+        """Close every browser; for CDP connections this only disconnects."""
+        browsers = self.retired
+        while not self.browsers.empty():
+            browsers.append(self.browsers.get_nowait())
+        for browser in browsers:
+            try:
+                await browser.close()
+            except Exception as e:
+                log.error("Error closing browser: %s", e)
+        self.retired = []
+        self.uses.clear()
+        self.opening.clear()
+        self.open_contexts.clear()
+        self.ready.clear()
+
+class AsyncFormFiller:
+    # Fill plans by form URL, shared by every filler in the process. A form's
+    # structure is fixed, so only the first submission (or the first after a
+    # failure, in case the form changed) has to inspect it.
+    plan_cache: Dict[str, List[Dict]] = {}
+
+    def __init__(
+        self, form_url: str, submission_count: int, names: List[CustomName], pool: BrowserPool,
+        on_result: Optional[Callable[[bool], None]] = None
+    ):
         self.form_url = form_url
         self.submission_count = submission_count
         self.successful_submissions = 0
         self.failed_submissions = 0
+        # The custom name for each of this filler's submissions, in order (see build_name_schedule)
         self.names = names
-        self.current_name_index = start_name_index
-        self.setup_browser()
+        # Where users come from is settled once here rather than on every submission
+        if names:
+            # Custom names were parsed and validated when they were entered
+            self.users = (self.build_user_data(*entry) for entry in names)
+        else:
+            # Without custom names, every submission's random user is drawn up front
+            self.users = self.generate_random_users(submission_count)
+        self.pool = pool
+        self.on_result = on_result
+        # This submission's context and page, set by setup_browser
+        self.context: Optional[BrowserContext] = None
+        self.page: Optional[Page] = None
+        # Plan the fill steps were compiled from, so they are rebuilt only when the cached plan changes
+        self.compiled_plan = None
+        self.fill_steps = []
 
-    def setup_browser(self):
-        """Initialize Playwright browser with appropriate options."""
+    async def setup_browser(self):
+        """Open an isolated context and page on one of the pooled browsers."""
+        self.context = None
         try:
-            self.playwright = sync_playwright().start()
-            self.browser = self.playwright.chromium.launch(
-                headless=True,
-                args=['--disable-dev-shm-usage']
-            )
-            self.context = self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080}
-            )
-            self.page = self.context.new_page()
+            self.context = await self.pool.new_context()
+            await self.context.route("**/*", block_unneeded_resources)
+            self.page = await self.context.new_page()
            
-            self.page.set_default_timeout(30000)
+            self.page.set_default_timeout(DEFAULT_TIMEOUT_MS)
+            self.page.set_default_navigation_timeout(NAVIGATION_TIMEOUT_MS)
         except Exception as e:
-            logging.error(f"Error setting up browser: {str(e)}")
+            log.error("Error setting up browser: %s", e)
             raise
 
-    def wait_for_form_load(self):
-        """Wait for the Google Form to load completely."""
+    async def wait_for_form_load(self):
+        """Wait until the first form question is in the DOM."""
         try:
-            self.page.wait_for_load_state("networkidle", timeout=30000)
-            time.sleep(3) 
-            logging.info("Form loaded successfully")
+            # Attached is enough: the form is server-rendered, and every later action waits for its own target
+            await self.page.wait_for_selector(FORM_QUESTION_SELECTOR, state="attached")
+            log.info("Form loaded successfully")
         except Exception as e:
-            logging.error(f"Error waiting for form to load: {str(e)}")
+            log.error("Error waiting for form to load: %s", e)
             raise
 
-    def get_question_text(self, question) -> str:
-        """Extract the question text from a form element."""
-        try:
-            # Try multiple selectors for question text
-            selectors = [
-                "div[role='heading'] span",
-                ".freebirdFormviewerComponentsQuestionBaseTitle",
-                ".freebirdFormviewerViewItemsItemItemTitle",
-                ".docssharedWizToggleLabeledLabelText",
-                ".M7eMe",
-                "label",
-                "span[aria-label]"
-            ]
-           
-            for selector in selectors:
-                try:
-                    element = question.locator(selector).first
-                    if element:
-                        text = element.inner_text().strip()
-                        if text and text != "":
-                            return text
-                except Exception:
-                    continue
-           
-            # Fallback: try to get any text content from the question container
-            try:
-                all_text = question.inner_text().strip()
-                if all_text:
-                    # Take first line as question text
-                    lines = [line.strip() for line in all_text.split('\n') if line.strip()]
-                    if lines:
-                        return lines[0]
-            except Exception:
-                pass
-           
-            return "Unknown Question"
-        except Exception as e:
-            logging.debug(f"Error getting question text: {str(e)}")
-            return "Unknown Question"
-
-    def identify_question_type(self, question) -> str:
-        """Identify the type of question based on its elements."""
-        try:
-            # Check for dropdown
-            dropdown = question.query_selector("select, div[role='listbox']")
-            if dropdown and dropdown.is_visible():
-                return "dropdown"
-           
-            # Check for multiple choice (radio buttons)
-            radio_count = question.query_selector_all("div[role='radio'], input[type='radio']")
-            visible_radios = [r for r in radio_count if r.is_visible()]
-            if visible_radios:
-                return "multiple_choice"
-           
-            # Check for checkboxes
-            checkbox_count = question.query_selector_all("div[role='checkbox'], input[type='checkbox']")
-            visible_checkboxes = [cb for cb in checkbox_count if cb.is_visible()]
-            if visible_checkboxes:
-                return "checkbox"
-           
-            # Check for text input
-            text_input = question.query_selector("input[type='text'], input[type='email']")
-            if text_input and text_input.is_visible():
-                return "short_answer"
-           
-            # Check for textarea
-            textarea = question.query_selector("textarea")
-            if textarea and textarea.is_visible():
-                return "paragraph"
-           
-            return "unknown"
-        except Exception as e:
-            logging.debug(f"Error identifying question type: {str(e)}")
-            return "unknown"
+    def build_user_data(self, name: str, age: str, gender_code: str, original_input: str) -> Dict[str, str]:
+        """Assemble the per-submission user data from its parts."""
+        # Map gender code to full gender and MCQ options
+        gender_info = GENDER_MAP.get(gender_code, OTHER_GENDER)
+        
+        return {
+            'name': name,
+            'age': age,
+            'gender_code': gender_code,
+            'gender_full': gender_info['full'],
+            'gender_options': gender_info['options'],
+            'original_input': original_input
+        }
 
-    def parse_custom_name(self, custom_input: str) -> Dict[str, str]:
-        """Parse custom name input in format name+age+gender(F/M)"""
-        try:
-            # Clean the input
-            custom_input = custom_input.strip()
-            
-            # Simple parsing: extract name (letters), age (digits), gender (F/M)
-            name_part = re.findall(r'[a-zA-Z]+', custom_input)
-            age_part = re.findall(r'\d+', custom_input)
-            gender_part = re.findall(r'[FMfm]', custom_input)
-            
-            if name_part and age_part and gender_part:
-                name = name_part[0]
-                age = age_part[0]
-                gender_code = gender_part[0].upper()
-            else:
-                # Fallback if parsing fails
-                name = custom_input
-                age = str(random.choice(SAMPLE_AGES))
-                gender_code = random.choice(['F', 'M'])
-            
-            # Map gender code to full gender and MCQ options
-            gender_map = {
-                'F': {'full': 'Female', 'options': ['Female', 'F', 'Girl', 'Woman', 'female']},
-                'M': {'full': 'Male', 'options': ['Male', 'M', 'Boy', 'Man', 'male']}
-            }
-            
-            gender_info = gender_map.get(gender_code, {'full': 'Other', 'options': ['Other', 'Prefer not to say', 'other']})
-            
-            return {
-                'name': name,
-                'age': age,
-                'gender_code': gender_code,
-                'gender_full': gender_info['full'],
-                'gender_options': gender_info['options'],
-                'original_input': custom_input
-            }
-        except Exception as e:
-            logging.error(f"Error parsing custom name '{custom_input}': {str(e)}")
-            # Fallback to random values
-            return {
-                'name': f"{random.choice(SAMPLE_FIRST_NAMES)}",
-                'age': str(random.choice(SAMPLE_AGES)),
-                'gender_code': random.choice(['F', 'M']),
-                'gender_full': random.choice(['Female', 'Male']),
-                'gender_options': ['Female', 'Male', 'Other', 'female', 'male'],
-                'original_input': custom_input
-            }
+    def generate_random_users(self, count: int):
+        """Yield count random users, drawing all names, ages and genders in one batch."""
+        names = random.choices(NAME_POOL, k=count)
+        ages = random.choices(SAMPLE_AGES, k=count)
+        gender_codes = random.choices(GENDER_CODES, k=count)
+        # Random users are assembled from their parts, no parsing needed
+        return (
+            self.build_user_data(name, str(age), gender_code, name)
+            for name, age, gender_code in zip(names, ages, gender_codes)
+        )
 
     def get_next_name(self) -> Dict[str, str]:
-        """Get the next name from the list and parse it."""
-        if not self.names:
-            # Generate a random name in the required format
-            random_name = f"{random.choice(SAMPLE_FIRST_NAMES)}{random.choice(SAMPLE_AGES)}{random.choice(['F', 'M'])}"
-            return self.parse_custom_name(random_name)
-       
-        custom_input = self.names[self.current_name_index]
-        self.current_name_index = (self.current_name_index + 1) % len(self.names)
-        return self.parse_custom_name(custom_input)
+        """Get the user data for the next submission."""
+        return next(self.users)
 
     def generate_email(self, name: str, domain: str = None) -> str:
         """Generate email from name with specified domain."""
         # Clean the name for email (remove spaces and special chars)
-        clean_name = re.sub(r'[^a-zA-Z0-9]', '', name.split()[0] if ' ' in name else name).lower()
+        clean_name = EMAIL_CLEAN_RE.sub('', name.split()[0] if ' ' in name else name).lower()
         if not domain:
             domain = random.choice(SAMPLE_EMAIL_DOMAINS)
         
@@ -212,563 +492,726 @@ class FormFiller:
         random_num = random.randint(1, 999)
         return f"{clean_name}{random_num}{domain}"
 
-    def detect_field_type(self, question_text: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def detect_field_type(question_text: str) -> str:
         """Detect the field type based on question text keywords."""
         if question_text == "Unknown Question":
             return "general"
-            
-        text_lower = question_text.lower()
         
-        if any(keyword in text_lower for keyword in ['email', 'e-mail', 'email address', 'e-mail address']):
-            return "email"
-        elif any(keyword in text_lower for keyword in ['name', 'full name', 'first name', 'last name', 'your name']):
-            return "name"
-        elif any(keyword in text_lower for keyword in ['age', 'how old', 'year of birth', 'birth year', 'your age']):
-            return "age"
-        elif any(keyword in text_lower for keyword in ['gender', 'sex', 'male/female', 'man/woman', 'select gender']):
-            return "gender"
-        
-        return "general"
+        # One scan finds every field mentioned; the highest-priority one wins
+        found = {match.lastgroup for match in FIELD_TYPE_RE.finditer(question_text)}
+        return next((field for field in FIELD_PRIORITY if field in found), "general")
+
+    async def wait_for_dropdown_options(self):
+        """Wait for an opened custom dropdown to render its option list."""
+        try:
+            await self.page.wait_for_selector(DROPDOWN_OPTION_SELECTOR, state="visible", timeout=DROPDOWN_OPEN_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            log.warning("Dropdown options did not appear")
 
-    def fill_dropdown(self, question, field_type: str, user_data: Dict[str, str]):
+    async def fill_dropdown(self, question: Locator, field_type: str, user_data: Dict[str, str]):
         """Handle dropdown question type with random selection."""
         try:
-            # Try different dropdown selectors
-            dropdown_selectors = [
-                "select",
-                "div[role='listbox']",
-                ".quantumWizMenuPaperselectOptionList"
-            ]
-            
-            for selector in dropdown_selectors:
-                dropdown = question.query_selector(selector)
-                if dropdown and dropdown.is_visible():
-                    dropdown.click()
-                    time.sleep(1)
-                    
-                    # Get options
-                    option_selectors = [
-                        "div[role='option']",
-                        "option",
-                        ".quantumWizMenuPaperselectOption"
-                    ]
-                    
-                    for opt_selector in option_selectors:
-                        options = self.page.query_selector_all(opt_selector)
-                        visible_options = [opt for opt in options if opt.is_visible() and opt.inner_text().strip()]
-                        
-                        if visible_options:
-                            # Skip first option if it's a placeholder
-                            if len(visible_options) > 1 and not visible_options[0].inner_text().strip():
-                                visible_options = visible_options[1:]
-                            
-                            if visible_options:
-                                chosen_option = random.choice(visible_options)
-                                chosen_option.click()
-                                time.sleep(0.5)
-                                return
-                    
-                    # If no options found, try to select by value
-                    select_element = question.query_selector("select")
-                    if select_element:
-                        options = select_element.query_selector_all("option:not([disabled])")
-                        if len(options) > 1:
-                            select_element.select_option(index=random.randint(1, len(options)-1))
-                            time.sleep(0.5)
-                    return
-                        
+            await self.choose_dropdown_option(question.locator(DROPDOWN_SELECTOR).first)
         except Exception as e:
-            logging.error(f"Error filling dropdown: {str(e)}")
+            log.error("Error filling dropdown: %s", e)
+
+    async def choose_dropdown_option(self, dropdown: Locator):
+        """Pick a random option of one dropdown, native or custom."""
+        tag_name = await dropdown.evaluate("el => el.tagName.toLowerCase()")
+        if tag_name == "select":
+            # Native selects take the choice directly; index 0 is the placeholder
+            option_count = await dropdown.locator("option:not([disabled])").count()
+            if option_count > 1:
+                await dropdown.select_option(index=random.randint(1, option_count - 1))
+            return
+
+        await dropdown.click()
+        await self.wait_for_dropdown_options()
+        if not await self.click_random_option():
+            log.warning("No options found in dropdown")
 
-    def fill_checkboxes(self, question, field_type: str, user_data: Dict[str, str]):
+    async def click_random_option(self) -> bool:
+        """Click a random labelled option of the open dropdown, skipping blank placeholders."""
+        options = self.page.locator(DROPDOWN_OPTION_SELECTOR)
+        # All labels in one round trip instead of an is_visible()/inner_text() pair per option
+        labels = await options.all_inner_texts()
+        candidates = [i for i, label in enumerate(labels) if label.strip()]
+        if not candidates:
+            return False
+        await options.nth(random.choice(candidates)).click()
+        return True
+
+    async def click_radio(self, question_idx: int, choice: Optional[int] = None) -> bool:
+        """Click a radio option of a question inside the page, in a single round trip.
+
+        Without a choice, a random option other than "Other" is picked in the browser.
+        """
+        return await self.page.evaluate(CLICK_RADIO_JS, [QUESTION_SELECTOR, question_idx, choice])
+
+    async def fill_checkboxes(self, question_idx: int, checkbox_count: int):
         """Handle checkbox question type with random selection of multiple options."""
         try:
-            checkboxes = question.query_selector_all("div[role='checkbox'], input[type='checkbox']")
-            visible_checkboxes = [cb for cb in checkboxes if cb.is_visible()]
-            
-            if not visible_checkboxes:
-                logging.warning("No visible checkboxes found")
+            if not checkbox_count:
+                log.warning("No visible checkboxes found")
                 return
             
-            # Determine how many checkboxes to select (at least 1, at most all)
-            max_to_select = len(visible_checkboxes)
-            min_to_select = min(1, max_to_select)
-            
-            # Randomly decide how many to select (between min and max)
-            num_to_select = random.randint(min_to_select, max_to_select)
-            
-            # Randomly select which checkboxes to click
-            checkboxes_to_select = random.sample(visible_checkboxes, num_to_select)
+            # Randomly decide how many to select (at least 1, at most all) and which ones
+            num_to_select = random.randint(1, checkbox_count)
+            checkboxes_to_select = random.sample(range(checkbox_count), num_to_select)
             
-            logging.info(f"Selecting {num_to_select} out of {len(visible_checkboxes)} checkboxes")
+            log.info("Selecting %s out of %s checkboxes", num_to_select, checkbox_count)
             
-            # Click the selected checkboxes
-            for checkbox in checkboxes_to_select:
-                try:
-                    checkbox.click()
-                    time.sleep(0.3)
-                except Exception as e:
-                    logging.warning(f"Could not click one checkbox: {str(e)}")
-                    continue
+            # Click all the selected checkboxes in one round trip
+            await self.page.evaluate(CLICK_CHECKBOXES_JS, [QUESTION_SELECTOR, question_idx, checkboxes_to_select])
                     
         except Exception as e:
-            logging.error(f"Error filling checkboxes: {str(e)}")
+            log.error("Error filling checkboxes: %s", e)
+
+    async def fill_text_fields(self, fills: List[list]):
+        """Write all text answers in one round trip, using fill() for fields the batch could not find.
+
+        fill() waits for its field, which covers inputs that had not rendered yet.
+        """
+        try:
+            missing = await self.page.evaluate(FILL_TEXT_JS, [QUESTION_SELECTOR, fills])
+        except Exception as e:
+            log.warning("Batched text fill failed, filling fields one by one: %s", e)
+            missing = fills
 
-    def fill_multiple_dropdowns(self, question, field_type: str, user_data: Dict[str, str]):
+        questions = self.page.locator(QUESTION_SELECTOR)
+        for idx, field_selector, value in missing:
+            try:
+                await questions.nth(idx).locator(field_selector).first.fill(value)
+            except Exception as e:
+                log.error("Error filling text for question %s: %s", idx + 1, e)
+
+    async def fill_multiple_dropdowns(self, question: Locator, field_type: str, user_data: Dict[str, str]):
         """Handle multiple dropdowns in a single question (like multi-select dropdowns)."""
         try:
             # Look for multiple dropdown elements within the question
-            dropdowns = question.query_selector_all("select, div[role='listbox']")
-            visible_dropdowns = [dd for dd in dropdowns if dd.is_visible()]
+            dropdowns = await question.locator(DROPDOWN_SELECTOR).all()
             
-            if not visible_dropdowns:
-                logging.warning("No visible dropdowns found for multiple dropdown handling")
+            if not dropdowns:
+                log.warning("No visible dropdowns found for multiple dropdown handling")
                 return
             
-            logging.info(f"Found {len(visible_dropdowns)} dropdowns in this question")
+            log.info("Found %s dropdowns in this question", len(dropdowns))
             
             # Process each dropdown
-            for i, dropdown in enumerate(visible_dropdowns):
+            for i, dropdown in enumerate(dropdowns):
                 try:
-                    dropdown.click()
-                    time.sleep(1)
-                    
-                    # Get options for this dropdown
-                    option_selectors = [
-                        "div[role='option']",
-                        "option",
-                        ".quantumWizMenuPaperselectOption"
-                    ]
-                    
-                    options_found = False
-                    for opt_selector in option_selectors:
-                        options = self.page.query_selector_all(opt_selector)
-                        visible_options = [opt for opt in options if opt.is_visible() and opt.inner_text().strip()]
-                        
-                        if visible_options:
-                            # Skip first option if it's a placeholder
-                            if len(visible_options) > 1 and not visible_options[0].inner_text().strip():
-                                visible_options = visible_options[1:]
-                            
-                            if visible_options:
-                                chosen_option = random.choice(visible_options)
-                                chosen_option.click()
-                                time.sleep(0.5)
-                                options_found = True
-                                break
-                    
-                    if not options_found:
-                        # Fallback: try select element
-                        select_element = dropdown if dropdown.tag_name == "select" else None
-                        if not select_element:
-                            select_element = dropdown.query_selector("select")
-                        
-                        if select_element:
-                            options = select_element.query_selector_all("option:not([disabled])")
-                            if len(options) > 1:
-                                select_element.select_option(index=random.randint(1, len(options)-1))
-                                time.sleep(0.5)
-                                
+                    await self.choose_dropdown_option(dropdown)
                 except Exception as e:
-                    logging.warning(f"Error processing dropdown {i+1}: {str(e)}")
+                    log.warning("Error processing dropdown %s: %s", i+1, e)
                     continue
                     
         except Exception as e:
-            logging.error(f"Error filling multiple dropdowns: {str(e)}")
+            log.error("Error filling multiple dropdowns: %s", e)
+
+    async def build_plan(self) -> List[Dict]:
+        """Load the form once and record how to answer each of its questions.
+
+        The structure of a form does not change between submissions, so the
+        selector probing and type detection are done here once and every
+        submission replays the resulting plan.
+        """
+        response = await self.page.goto(self.form_url, wait_until="domcontentloaded", timeout=FORM_LOAD_TIMEOUT_MS)
+        if response is not None and not response.ok:
+            raise ValueError(f"Form URL returned HTTP {response.status}: {self.form_url}")
+        await self.wait_for_form_load()
 
-    def get_real_questions(self):
-        """Get only real form questions, not decorative elements."""
+        plan = await self.extract_plan_js()
+
+        for step in plan:
+            log.info(
+                "Question %d: '%s' (field type: %s, question type: %s)",
+                step['idx'] + 1, step['text'], step['field_type'], step['type']
+            )
+        log.info("Built fill plan for %s questions", len(plan))
+        if plan:
+            self.plan_cache[self.form_url] = plan
+        return plan
+
+    async def extract_plan_js(self) -> List[Dict]:
+        """Classify every question in a single in-browser pass."""
         try:
-            # More specific selectors for actual questions
-            question_selectors = [
-                ".freebirdFormviewerComponentsQuestionBaseRoot",
-                ".freebirdFormviewerViewItemsItemItem",
-                "div[role='listitem']",  # But filter these more carefully
-                ".quantumWizTextinputPaperinputMainContent",
-                ".freebirdFormviewerComponentsQuestionRadioRoot",
-                ".freebirdFormviewerComponentsQuestionCheckboxRoot"
-            ]
-            
-            all_elements = []
-            for selector in question_selectors:
-                elements = self.page.query_selector_all(selector)
-                all_elements.extend(elements)
-            
-            # Remove duplicates and filter visible elements
-            unique_elements = []
-            seen = set()
-            for element in all_elements:
-                if element in seen:
-                    continue
-                seen.add(element)
-                
-                if element.is_visible():
-                    # Additional filtering for listitems - they should contain form controls
-                    if "listitem" in str(element.get_attribute("role") or ""):
-                        has_controls = element.query_selector("input, textarea, select, [role='radio'], [role='checkbox']")
-                        if has_controls:
-                            unique_elements.append(element)
-                    else:
-                        unique_elements.append(element)
-            
-            logging.info(f"Found {len(unique_elements)} real questions after filtering")
-            return unique_elements
-            
+            plan = await self.page.evaluate(EXTRACT_PLAN_JS, QUESTION_SELECTOR)
         except Exception as e:
-            logging.error(f"Error getting real questions: {str(e)}")
+            log.error("Error scanning questions: %s", e)
             return []
+        for step in plan:
+            step["field_type"] = self.detect_field_type(step["text"])
+        return plan
 
-    def fill_form(self) -> bool:
-        """Fill a single form with responses."""
-        try:
-            self.page.goto(self.form_url, wait_until="networkidle", timeout=60000)
-            self.wait_for_form_load()
+    def count_free_text(self, plan: List[Dict], question_type: str) -> int:
+        """Count planned questions of this type that get a generic (not personal) answer."""
+        return sum(
+            1 for step in plan
+            if step["type"] == question_type and step["field_type"] not in PERSONAL_TEXT_FIELDS
+        )
 
-            # Get parsed user data
-            user_data = self.get_next_name()
-            logging.info(f"Using data for this submission: {user_data}")
+    def compile_plan(self, plan: List[Dict]) -> List[tuple]:
+        """Turn the plan into (question number, fill step) pairs, skipping unknown question types."""
+        fill_steps = []
+        for step in plan:
+            fill_step = self.compile_step(step)
+            if fill_step:
+                fill_steps.append((step["idx"] + 1, fill_step))
+        return fill_steps
 
-            # Get real questions with better filtering
-            questions = self.get_real_questions()
-            
-            if not questions:
-                logging.error("No real questions found on the form")
-                # Fallback to original method
-                question_selectors = ["div[role='listitem']", ".freebirdFormviewerComponentsQuestionBaseRoot"]
-                for selector in question_selectors:
-                    questions = self.page.query_selector_all(selector)
-                    if questions:
-                        break
-
-            if not questions:
-                logging.error("No questions found at all")
-                return False
+    def compile_step(self, step: Dict) -> Optional[Callable]:
+        """Bind one plan step to the filler it needs, so submissions skip the per-question dispatch.
 
-            logging.info(f"Processing {len(questions)} questions")
+        Each fill step is called with the submission's user data, its free-text answer
+        iterators by question type, and the list collecting batched text fills.
+        """
+        idx = step["idx"]
+        i = idx + 1
+        field_type = step["field_type"]
+        question_type = step["type"]
 
-            # Process each question
-            for i, question in enumerate(questions, 1):
-                try:
-                    if not question.is_visible():
-                        continue
+        if question_type in ("dropdown", "multi_dropdown"):
+            fill_dropdowns = self.fill_dropdown if question_type == "dropdown" else self.fill_multiple_dropdowns
 
-                    question.scroll_into_view_if_needed()
-                    time.sleep(0.3)
+            async def fill_step(user_data, responses, text_fills):
+                await fill_dropdowns(self.page.locator(QUESTION_SELECTOR).nth(idx), field_type, user_data)
 
-                    question_text = self.get_question_text(question)
-                    logging.info(f"Processing question {i}: '{question_text}'")
+        elif question_type == "multiple_choice":
+            options = step["options"]
 
-                    # Detect field type based on question text
-                    field_type = self.detect_field_type(question_text)
-                    question_type = self.identify_question_type(question)
-                    
-                    logging.info(f"Field type: {field_type}, Question type: {question_type}")
-
-                    if question_type == "dropdown":
-                        self.fill_dropdown(question, field_type, user_data)
-                        
-                    elif question_type == "multiple_choice":
-                        options = question.query_selector_all("div[role='radio'], input[type='radio']")
-                        visible_options = [opt for opt in options if opt.is_visible()]
-                       
-                        if visible_options:
-                            # For gender questions, try to select matching option
-                            if field_type == "gender":
-                                matched = False
-                                for option in visible_options:
-                                    # Try to get option text from various places
-                                    option_text = ""
-                                    try:
-                                        # Get text from parent or sibling elements
-                                        parent = option.query_selector("xpath=..")
-                                        if parent:
-                                            option_text = parent.inner_text().lower()
-                                        else:
-                                            option_text = option.get_attribute("aria-label") or ""
-                                    except:
-                                        pass
-                                    
-                                    for gender_option in user_data['gender_options']:
-                                        if gender_option.lower() in option_text.lower():
-                                            option.click()
-                                            time.sleep(0.5)
-                                            logging.info(f"Selected gender option: {gender_option}")
-                                            matched = True
-                                            break
-                                    if matched:
-                                        break
-                                
-                                if not matched:
-                                    # If no gender match found, select random option
-                                    chosen_option = random.choice(visible_options)
-                                    chosen_option.click()
-                                    time.sleep(0.5)
-                            else:
-                                # For non-gender MCQ, select random option
-                                chosen_option = random.choice(visible_options)
-                                chosen_option.click()
-                                time.sleep(0.5)
-                           
-                            logging.info(f"Selected option for question {i}")
-                        else:
-                            logging.warning(f"No visible options found for question {i}")
-
-                    elif question_type in ["short_answer", "paragraph"]:
-                        input_element = None
-                        if question_type == "short_answer":
-                            input_element = question.query_selector("input[type='text'], input[type='email']")
-                        else:
-                            input_element = question.query_selector("textarea")
-                       
-                        if input_element and input_element.is_visible():
-                            if field_type == "name":
-                                input_element.fill(user_data['name'])
-                                logging.info(f"Filled name: {user_data['name']}")
-                            elif field_type == "email":
-                                email = self.generate_email(user_data['name'])
-                                input_element.fill(email)
-                                logging.info(f"Filled email: {email}")
-                            elif field_type == "age":
-                                input_element.fill(user_data['age'])
-                                logging.info(f"Filled age: {user_data['age']}")
-                            else:
-                                # For general text fields
-                                if question_type == "short_answer":
-                                    responses = ["Yes", "No", "Maybe", "Sometimes", "Often"]
-                                    response = random.choice(responses)
-                                    input_element.fill(response)
-                                    logging.info(f"Filled short answer: {response}")
-                                else:
-                                    responses = [
-                                        "This is a detailed response.",
-                                        "Based on my experience, this is the best approach."
-                                    ]
-                                    response = random.choice(responses)
-                                    input_element.fill(response)
-                                    logging.info(f"Filled paragraph: {response}")
-                            time.sleep(0.3)
-
-                    elif question_type == "checkbox":
-                        # Use the enhanced checkbox filling method
-                        self.fill_checkboxes(question, field_type, user_data)
-
-                    # Handle multiple dropdowns in a single question
-                    elif question_type == "dropdown" and question.query_selector_all("select, div[role='listbox']").count() > 1:
-                        self.fill_multiple_dropdowns(question, field_type, user_data)
+            async def fill_step(user_data, responses, text_fills):
+                if not options:
+                    log.warning("No visible options found for question %s", i)
+                    return
+                # For gender questions, try to select matching option
+                choice = self.choose_gender_option(options, user_data) if field_type == "gender" else None
+                if await self.click_radio(idx, choice):
+                    log.info("Selected option for question %s", i)
+                else:
+                    log.warning("No selectable options found for question %s", i)
 
-                except Exception as e:
-                    logging.error(f"Error processing question {i}: {str(e)}")
-                    continue
+        elif question_type in ("short_answer", "paragraph"):
+            field_selector = SHORT_ANSWER_SELECTOR if question_type == "short_answer" else PARAGRAPH_SELECTOR
+            if field_type == "name":
+                label, get_value = "name", lambda user_data, responses: user_data['name']
+            elif field_type == "email":
+                label, get_value = "email", lambda user_data, responses: self.generate_email(user_data['name'])
+            elif field_type == "age":
+                label, get_value = "age", lambda user_data, responses: user_data['age']
+            else:
+                # For general text fields
+                label = question_type.replace("_", " ")
+                get_value = lambda user_data, responses: next(responses[question_type])
 
-            # Submit the form
-            submit_button = None
-            submit_button_selectors = [
-                "div[role='button']:has-text('Submit')",
-                "button:has-text('Submit')",
-                ".freebirdFormviewerViewNavigationSubmitButton",
-                "div[jsname='M2UYVd']",
-                "input[type='submit']"
-            ]
+            async def fill_step(user_data, responses, text_fills):
+                value = get_value(user_data, responses)
+                log.info("Filling %s: %s", label, value)
+                # Written together after the loop
+                text_fills.append([idx, field_selector, value])
+
+        elif question_type == "checkbox":
+            checkbox_count = step.get("checkboxes", 0)
+
+            async def fill_step(user_data, responses, text_fills):
+                await self.fill_checkboxes(idx, checkbox_count)
+
+        else:
+            return None
+
+        return fill_step
+
+    def choose_gender_option(self, options: List[str], user_data: Dict[str, str]) -> Optional[int]:
+        """Return the index of the first option matching the user's gender, if any."""
+        for index, option_text in enumerate(options):
+            for gender_option in user_data['gender_options']:
+                if gender_option.lower() in option_text:
+                    log.info("Selected gender option: %s", gender_option)
+                    return index
+        return None
 
-            for selector in submit_button_selectors:
+    async def fill_form(self) -> bool:
+        """Fill a single form with responses."""
+        try:
+            plan = self.plan_cache.get(self.form_url)
+            if plan is None:
+                plan = await self.build_plan()
+            else:
+                await self.page.goto(self.form_url, wait_until="domcontentloaded", timeout=FORM_LOAD_TIMEOUT_MS)
+                await self.wait_for_form_load()
+
+            if not plan:
+                log.error("No questions found at all")
+                return False
+
+            # Get parsed user data
+            user_data = self.get_next_name()
+            log.info("Using data for this submission: %s", user_data)
+            log.info("Processing %s questions", len(plan))
+
+            # Draw every free-text answer for this submission in one call per kind
+            responses = {
+                "short_answer": iter(random.choices(SHORT_RESPONSES, k=self.count_free_text(plan, "short_answer"))),
+                "paragraph": iter(random.choices(PARAGRAPH_RESPONSES, k=self.count_free_text(plan, "paragraph")))
+            }
+
+            if self.compiled_plan is not plan:
+                self.fill_steps = self.compile_plan(plan)
+                self.compiled_plan = plan
+
+            text_fills = []
+            for i, fill_step in self.fill_steps:
                 try:
-                    button = self.page.query_selector(selector)
-                    if button and button.is_visible():
-                        submit_button = button
-                        logging.info(f"Found submit button using selector: {selector}")
-                        break
+                    await fill_step(user_data, responses, text_fills)
                 except Exception as e:
+                    log.error("Error processing question %s: %s", i, e)
                     continue
 
-            if submit_button:
-                submit_button.scroll_into_view_if_needed()
-                time.sleep(1)
-                submit_button.click()
-                time.sleep(5)
+            if text_fills:
+                await self.fill_text_fields(text_fills)
+
+            # Submit the form; the click auto-waits for whichever variant of the button shows up first
+            submit_button = self.page.get_by_role("button", name=SUBMIT_BUTTON_NAME_RE).or_(
+                self.page.locator(SUBMIT_BUTTON_SELECTOR)
+            ).first
+            try:
+                await submit_button.click()
+                submitted = True
+            except PlaywrightTimeoutError:
+                submitted = False
+
+            if submitted:
 
-                # Check for success
+                # The confirmation message is the one reliable signal that the response was recorded
+                confirmation = self.page.locator(CONFIRMATION_SELECTOR).or_(
+                    self.page.get_by_text(CONFIRMATION_TEXT)
+                ).first
                 try:
-                    success_indicators = [
-                        "Your response has been recorded",
-                        "Thank you for completing",
-                        "Form submitted successfully",
-                        "responseConfirmationHeader"
-                    ]
-                    
-                    page_text = self.page.inner_text("body").lower()
-                    if any(indicator.lower() in page_text for indicator in success_indicators):
-                        logging.info("Form submitted successfully")
+                    await expect(confirmation).to_be_visible(timeout=CONFIRMATION_TIMEOUT_MS)
+                    log.info("Form submitted successfully")
+                    return True
+                except AssertionError:
+                    # Forms with a custom confirmation message still land on the formResponse page
+                    if "formResponse" in self.page.url:
+                        log.info("Form submitted successfully (confirmed by URL)")
                         return True
-                    else:
-                    
-                        current_url = self.page.url
-                        if "formResponse" in current_url or "thankyou" in current_url:
-                            logging.info("Form submitted successfully (URL change detected)")
-                            return True
-                        
-                        logging.warning("Submission success not confirmed")
-                        return False
-                        
-                except Exception as e:
-                    logging.error(f"Error checking submission status: {str(e)}")
+                    log.warning("Submission success not confirmed")
                     return False
             else:
-                logging.error("Could not find submit button")
+                log.error("Could not find submit button")
                 return False
 
         except Exception as e:
-            logging.error(f"Error filling form: {str(e)}")
+            log.error("Error filling form: %s", e)
             return False
 
-    def run(self):
-        """Run a single form submission."""
-        success = self.fill_form()
-        if success:
-            self.successful_submissions += 1
-        else:
-            self.failed_submissions += 1
-        self.cleanup()
-        return success
+    async def run(self) -> int:
+        """Run this filler's submissions back to back, each in a fresh context.
+
+        Returns the number of successful submissions.
+        """
+        for submission in range(self.submission_count):
+            # A long-lived context keeps every request and response object alive, so each
+            # submission gets its own and closes it straight after
+            try:
+                await self.setup_browser()
+                success = await self.fill_form()
+            except Exception:
+                # setup_browser has logged it; a broken browser costs this submission, not the whole share
+                success = False
+            finally:
+                await self.cleanup()
+            if success:
+                self.successful_submissions += 1
+            else:
+                self.failed_submissions += 1
+                # The form may have changed under us; re-inspect it next time
+                self.plan_cache.pop(self.form_url, None)
+            if self.on_result:
+                self.on_result(success)
+        return self.successful_submissions
 
     def log_summary(self, duration: float):
         """Log the summary of the form filling process."""
-        logging.info(
-            f"""
-Form submission completed:
-- Total submissions attempted: {self.submission_count}
-- Successful submissions: {self.successful_submissions}
-- Failed submissions: {self.failed_submissions}
-- Time taken: {duration:.2f} seconds
-- Average rate: {self.successful_submissions / duration:.2f} submissions/second
-"""
+        log.info(
+            SUMMARY_TEMPLATE, "Form submission", self.submission_count, self.successful_submissions,
+            self.failed_submissions, duration, self.successful_submissions / duration
         )
 
-    def cleanup(self):
-        """Clean up resources."""
+    async def cleanup(self):
+        """Close this submission's context, and with it its page; the pooled browsers stay up."""
+        if self.context is None:
+            return
         try:
-            self.context.close()
-            self.browser.close()
-            self.playwright.stop()
+            await self.pool.release(self.context)
         except Exception as e:
-            logging.error(f"Error during cleanup: {str(e)}")
+            log.error("Error during cleanup: %s", e)
+        finally:
+            self.context = None
 
 def setup_logging():
-    """Set up logging configuration."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
+    """Send the script's log records to stderr through a single handler."""
+    # Forked worker processes inherit the parent's handler; don't add a second one
+    if log.handlers:
+        return
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"))
+    log.addHandler(handler)
+    log.setLevel(logging.INFO)
+    # Records stop here instead of also walking up to the root logger
+    log.propagate = False
+
+async def build_form_plan(pool: BrowserPool, form_url: str) -> List[Dict]:
+    """Build the form's fill plan once on a bootstrap page, filling the plan cache."""
+    bootstrap = AsyncFormFiller(form_url, submission_count=0, names=[], pool=pool)
+    await bootstrap.setup_browser()
+    try:
+        plan = await bootstrap.build_plan()
+    finally:
+        await bootstrap.cleanup()
+    if not plan:
+        # Every submission would just rebuild the plan and fail the same way
+        raise ValueError(f"No questions found on the form: {form_url}")
+    return plan
+
+def make_progress_logger(submission_count: int, start_time: float) -> Callable[[bool], None]:
+    """Return a callback that logs the overall rate every PROGRESS_LOG_INTERVAL submissions."""
+    completed = itertools.count(1)
+
+    def record(success: bool):
+        done = next(completed)
+        # The rate is only worth computing when the progress line will actually be written
+        if done % PROGRESS_LOG_INTERVAL == 0 and log.isEnabledFor(logging.INFO):
+            log.info(PROGRESS_TEMPLATE, done, submission_count, done / (time.monotonic() - start_time))
+
+    return record
+
+def log_run_summary(label: str, submission_count: int, successful_submissions: int, duration: float):
+    """Log the totals of a batch of submissions."""
+    log.info(
+        SUMMARY_TEMPLATE, label, submission_count, successful_submissions,
+        submission_count - successful_submissions, duration, successful_submissions / duration
     )
 
-def submission_worker(form_url: str, names: List[str], start_name_index: int) -> bool:
-    """Worker function for handling a single form submission in a separate thread."""
+def split_evenly(total: int, parts: int) -> List[int]:
+    """Split total into parts sizes that differ by at most one."""
+    return [total // parts + (1 if i < total % parts else 0) for i in range(parts)]
+
+def build_name_schedule(names: List[CustomName], submission_count: int) -> List[CustomName]:
+    """List the custom name for every submission, cycling through names; empty for random users.
+
+    Slices of the schedule are handed to processes and workers, so none of them
+    has to carry the whole list or track its own offset into it.
+    """
+    if not names:
+        return []
+    return list(itertools.islice(itertools.cycle(names), submission_count))
+
+def shares_of(name_schedule: List[CustomName], shares: List[int]) -> List[List[CustomName]]:
+    """Cut a name schedule into consecutive pieces of the given sizes (all empty for random users)."""
+    offsets = itertools.accumulate(shares, initial=0)
+    return [name_schedule[start:start + share] for start, share in zip(offsets, shares)]
+
+async def run_async_submissions(
+    form_url: str, submission_count: int, name_schedule: List[CustomName], max_concurrency: int = None,
+    cdp_url: Optional[str] = None, browsers: int = 1, headless: bool = True
+) -> int:
+    """Run form submissions concurrently on a single event loop.
+
+    Returns the number of successful submissions.
+    """
+    start_time = time.monotonic()
+
+    if max_concurrency is None:
+        max_concurrency = DEFAULT_CONCURRENCY
+    max_concurrency = max(1, min(max_concurrency, submission_count))
+
+    log.info(
+        "Starting %d async submissions with %d workers (process can use %d CPU cores)",
+        submission_count, max_concurrency, CPU_COUNT
+    )
+
+    async with async_playwright() as playwright:
+        pool = BrowserPool(playwright, size=browsers, cdp_url=cdp_url, headless=headless)
+        try:
+            await pool.start()
+            # Each worker owns one filler and works through its chunk of submissions
+            on_result = make_progress_logger(submission_count, start_time)
+            shares = split_evenly(submission_count, max_concurrency)
+            fillers = [
+                AsyncFormFiller(form_url, submission_count=share, names=names, pool=pool, on_result=on_result)
+                for share, names in zip(shares, shares_of(name_schedule, shares)) if share
+            ]
+            # Open every worker's first context while the bootstrap page builds the plan. That page
+            # doubles as a probe of the URL: if it fails, the warm-up is cancelled and pool.close()
+            # disposes of whatever it had opened
+            warm_up = asyncio.ensure_future(pool.warm(len(fillers)))
+            try:
+                await build_form_plan(pool, form_url)
+            except BaseException:
+                warm_up.cancel()
+                raise
+            await warm_up
+            # A failing worker comes back as its exception; the others run to completion
+            results = await asyncio.gather(*[filler.run() for filler in fillers], return_exceptions=True)
+        finally:
+            # Closing the browsers also tears down any context left open by a failed submission
+            await pool.close()
+
+    for result in results:
+        if isinstance(result, BaseException):
+            log.error("Worker error: %s", result)
+    # Fillers keep their own count, so a worker that failed part way still reports what it submitted
+    successful_submissions = sum(filler.successful_submissions for filler in fillers)
+    log_run_summary("Async submission", submission_count, successful_submissions, time.monotonic() - start_time)
+    return successful_submissions
+
+def run_event_loop(coroutine):
+    """Run a coroutine to completion on a new event loop, using uvloop when it is installed."""
+    if uvloop is not None:
+        if hasattr(uvloop, "run"):
+            return uvloop.run(coroutine)
+        # uvloop before 0.18 has no run(); select it through the event loop policy instead
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(coroutine)
+
+def split_cpus(parts: int) -> List[Optional[List[int]]]:
+    """Deal the CPUs this process may run on into parts disjoint sets, None where there are too few."""
+    if not hasattr(os, "sched_getaffinity"):
+        log.warning("CPU pinning is not supported on this platform")
+        return [None] * parts
+    cpus = sorted(os.sched_getaffinity(0))
+    return [cpus[i::parts] or None for i in range(parts)]
+
+def pin_to_cpus(cpus: List[int]):
+    """Restrict this process, and the driver and browsers it launches from now on, to the given CPUs."""
     try:
-        form_filler = FormFiller(form_url, submission_count=1, names=names, start_name_index=start_name_index)
-        return form_filler.run()
-    except Exception as e:
-        logging.error(f"Worker thread error: {str(e)}")
-        return False
+        os.sched_setaffinity(0, cpus)
+        log.info("Pinned process to CPUs %s", cpus)
+    except OSError as e:
+        log.warning("Could not pin process to CPUs %s: %s", cpus, e)
+
+def submission_process(
+    form_url: str, submission_count: int, name_schedule: List[CustomName], workers: Optional[int],
+    cdp_url: Optional[str], browsers: int, headless: bool, cpus: Optional[List[int]] = None
+) -> int:
+    """Run a share of the submissions in a child process with its own event loop."""
+    setup_logging()
+    if cpus:
+        # Affinity is inherited, so the Playwright driver and Chromium started below stay on these CPUs
+        pin_to_cpus(cpus)
+    return run_event_loop(
+        run_async_submissions(
+            form_url, submission_count, name_schedule, max_concurrency=workers, cdp_url=cdp_url, browsers=browsers,
+            headless=headless
+        )
+    )
 
-def run_threaded_submissions(
-    form_url: str, submission_count: int, names: List[str], max_workers: int = None
-):
-    """Run form submissions using multiple threads."""
+def run_sharded_submissions(
+    form_url: str, submission_count: int, name_schedule: List[CustomName], processes: int, workers: Optional[int] = None,
+    cdp_url: Optional[str] = None, browsers: int = 1, pin_cpus: bool = False, headless: bool = True
+) -> int:
+    """Spread submissions over several processes, each driving its own browser.
+
+    Returns the number of successful submissions.
+    """
     successful_submissions = 0
-    failed_submissions = 0
-    start_time = time.time()
+    start_time = time.monotonic()
 
-    cpu_count = multiprocessing.cpu_count()
-    usable_cpu_count = max(cpu_count // 2, 1)
-    if max_workers is None:
-        max_workers = min(usable_cpu_count, submission_count)
+    log.info("Splitting %s submissions across %s processes", submission_count, processes)
 
-    logging.info(
-        f"Starting {submission_count} threaded submissions with {max_workers} workers "
-        f"(System has {cpu_count} CPU cores)"
-    )
+    cpu_sets = split_cpus(processes) if pin_cpus else [None] * processes
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        shares = split_evenly(submission_count, processes)
         futures = [
-            executor.submit(submission_worker, form_url, names, i % len(names) if names else 0)
-            for i in range(submission_count)
+            executor.submit(submission_process, form_url, share, names, workers, cdp_url, browsers, headless, cpus)
+            for share, names, cpus in zip(shares, shares_of(name_schedule, shares), cpu_sets) if share
         ]
 
-        for i, future in enumerate(as_completed(futures), 1):
+        errors = []
+        for future in as_completed(futures):
             try:
-                if future.result():
-                    successful_submissions += 1
-                else:
-                    failed_submissions += 1
+                successful_submissions += future.result()
+            except Exception as e:
+                log.error("Worker process error: %s", e)
+                errors.append(e)
 
-                if i % 5 == 0:
-                    current_rate = i / (time.time() - start_time)
-                    logging.info(
-                        f"Completed {i}/{submission_count} submissions. "
-                        f"Current rate: {current_rate:.2f}/sec"
-                    )
+    if len(errors) == len(futures):
+        # Every process failed before submitting (e.g. the form has no questions); fail as a single process would
+        raise errors[0]
 
-            except Exception as e:
-                failed_submissions += 1
-                logging.error(f"Future error: {str(e)}")
-
-    duration = time.time() - start_time
-    logging.info(
-        f"""
-Thread pool submission completed:
-- Total submissions attempted: {submission_count}
-- Successful submissions: {successful_submissions}
-- Failed submissions: {failed_submissions}
-- Time taken: {duration:.2f} seconds
-- Average rate: {successful_submissions / duration:.2f} submissions/second
-"""
+    log_run_summary("Process pool submission", submission_count, successful_submissions, time.monotonic() - start_time)
+    return successful_submissions
+
+def validate_form_url(form_url: str):
+    """Reject URLs that cannot be a form before any browser or process is started."""
+    parsed = urllib.parse.urlparse(form_url)
+    if parsed.scheme not in ("http", "https") or not parsed.netloc:
+        raise ValueError(f"Not a valid form URL: {form_url!r}")
+
+def probe_form_url(form_url: str):
+    """Fetch the form once over plain HTTP so a dead link fails before any browser or process starts."""
+    try:
+        with urllib.request.urlopen(form_url, timeout=FORM_LOAD_TIMEOUT_MS / 1000):
+            pass
+    except urllib.error.HTTPError as e:
+        raise ValueError(f"Form URL returned HTTP {e.code}: {form_url}") from e
+    except OSError as e:
+        raise ValueError(f"Could not reach form URL {form_url}: {e}") from e
+
+def run_batch(
+    form_url: str, submission_count: int, names: List[CustomName], workers: Optional[int] = None, processes: int = 1,
+    cdp_url: Optional[str] = None, browsers: int = 1, pin_cpus: bool = False, headless: bool = True
+) -> int:
+    """Run a batch of submissions to completion from synchronous code.
+
+    names are custom names as returned by parse_custom_name; workers is the
+    number of concurrent submissions per process; pin_cpus gives each process
+    its own CPUs when running more than one. Returns the number of successful
+    submissions.
+    """
+    validate_form_url(form_url)
+    probe_form_url(form_url)
+    processes = max(1, min(processes, submission_count))
+    name_schedule = build_name_schedule(names, submission_count)
+    if processes > 1:
+        return run_sharded_submissions(
+            form_url, submission_count, name_schedule, processes, workers=workers, cdp_url=cdp_url, browsers=browsers,
+            pin_cpus=pin_cpus, headless=headless
+        )
+    return run_event_loop(run_async_submissions(
+        form_url, submission_count, name_schedule, max_concurrency=workers, cdp_url=cdp_url, browsers=browsers,
+        headless=headless
+    ))
+
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least one."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive number, got {value}")
+    return number
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line options; on a terminal, anything left out is asked for interactively."""
+    parser = argparse.ArgumentParser(description="Fill a Google Form multiple times with randomized answers.")
+    parser.add_argument("--url", help="Google Form URL (prompted for if omitted)")
+    parser.add_argument("--count", type=positive_int, help="number of submissions to make (prompted for if omitted)")
+    parser.add_argument(
+        "--names-file", type=argparse.FileType("r"),
+        help="file with one name+age+gender entry per line (default: read from standard input, "
+             "or use random names when --url and --count are given on a terminal)"
+    )
+    parser.add_argument(
+        "--workers", "--concurrency", type=positive_int,
+        help=f"concurrent in-flight submissions per process (default: {DEFAULT_CONCURRENCY})"
+    )
+    parser.add_argument(
+        "--processes", type=positive_int, default=1,
+        help="number of worker processes, each with its own event loop and browser (default: 1)"
+    )
+    parser.add_argument(
+        "--headless", action=argparse.BooleanOptionalAction, default=True,
+        help="run launched browsers without a window (default: on; ignored with --cdp-url)"
     )
+    parser.add_argument(
+        "--cdp-url", default=os.environ.get("CDP_ENDPOINT"),
+        help="connect to a running Chromium over CDP (e.g. http://localhost:9222) instead of launching one "
+             "(default: $CDP_ENDPOINT)"
+    )
+    parser.add_argument(
+        "--browsers", type=positive_int, default=1,
+        help="number of browsers each process keeps open and spreads submissions over (default: 1)"
+    )
+    parser.add_argument(
+        "--pin-cpus", action="store_true",
+        help="with --processes, pin each process and its browsers to a disjoint set of CPUs (Linux only)"
+    )
+    args = parser.parse_args()
+    if not sys.stdin.isatty():
+        # Nobody is there to answer the prompts (piped input, a scheduler)
+        missing = [flag for flag, value in (("--url", args.url), ("--count", args.count)) if not value]
+        if missing:
+            parser.error(f"{' and '.join(missing)} required when standard input is not a terminal")
+    return args
 
-def get_names_from_user() -> List[str]:
-    """Get list of names from user input."""
-    print("\nEnter names for each submission in format: name+age+gender(F/M)")
-    print("Example: Zuck41M")
-    print("Press Enter twice when done.")
-    print("If you don't enter enough names, random names will be used for remaining submissions.")
+def parse_custom_name(custom_input: str) -> Optional[CustomName]:
+    """Parse custom name input in format name+age+gender(F/M), or return None if it does not match."""
+    custom_input = custom_input.strip()
+    # Simple parsing: name (letters), then age (digits), then gender (F/M)
+    match = CUSTOM_NAME_RE.fullmatch(custom_input)
+    if not match:
+        return None
+    name, age, gender_code = match.groups()
+    return name, age, gender_code.upper(), custom_input
+
+def read_names(lines) -> List[CustomName]:
+    """Parse non-blank lines into custom names, reporting and skipping malformed ones."""
     names = []
-    while True:
-        name = input().strip()
-        if not name:
-            if names: 
-                break
-            else:
-                print("Please enter at least one name or press Enter again to use random names.")
-                continue
-        names.append(name)
+    for line in lines:
+        if not line.strip():
+            continue
+        # Parsed once here, so bad input is reported now rather than inside a worker
+        parsed = parse_custom_name(line)
+        if parsed:
+            names.append(parsed)
+        else:
+            print(f"Skipping '{line.strip()}': expected name+age+gender, e.g. Zuck41M")
     return names
 
-def main():
-    """Main entry point of the script."""
-    setup_logging()
+def get_names_from_user() -> List[CustomName]:
+    """Read and parse names from standard input until a blank line or end of input."""
+    print("\nEnter names for each submission in format: name+age+gender(F/M)")
+    print("Example: Zuck41M")
+    print("Press Enter twice (or Ctrl-D) when done.")
+    print("If you don't enter enough names, random names will be used for remaining submissions.")
+    # Iterating stdin directly also lets a names file be piped in: python main.py < names.txt
+    return read_names(itertools.takewhile(lambda line: line.strip(), sys.stdin))
 
-    form_url = input("Enter the Google Form URL: ").strip()
+def get_submission_count() -> int:
+    """Prompt until a positive number of submissions is entered."""
     while True:
         try:
             submission_count = int(input("Enter the number of submissions to make: "))
             if submission_count > 0:
-                break
+                return submission_count
             print("Please enter a positive number.")
         except ValueError:
             print("Please enter a valid number.")
 
-    print("\nEnter the names to use for submissions (format: name+age+gender):")
-    names = get_names_from_user()
+def main():
+    """Main entry point of the script."""
+    args = parse_args()
+    setup_logging()
+
+    form_url = args.url or input("Enter the Google Form URL: ").strip()
+    submission_count = args.count or get_submission_count()
+
+    if args.names_file:
+        with args.names_file as names_file:
+            names = read_names(names_file)
+    elif args.url and args.count and sys.stdin.isatty():
+        # Fully specified on the command line, so don't stop to ask for names
+        names = []
+    else:
+        print("\nEnter the names to use for submissions (format: name+age+gender):")
+        names = get_names_from_user()
     print(f"\nUsing {len(names)} names for submissions")
     if len(names) < submission_count:
         print(f"Will use random names for the remaining {submission_count - len(names)} submissions")
 
     try:
-        run_threaded_submissions(form_url, submission_count, names)
+        run_batch(
+            form_url, submission_count, names, workers=args.workers, processes=args.processes,
+            cdp_url=args.cdp_url, browsers=args.browsers, pin_cpus=args.pin_cpus, headless=args.headless
+        )
     except KeyboardInterrupt:
-        logging.info("Operation interrupted by user")
+        log.info("Operation interrupted by user")
         sys.exit(1)
     except Exception as e:
-        logging.error(f"Fatal error: {str(e)}")
+        log.error("Fatal error: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()